@@ -22,7 +22,7 @@ from .....utils import logging
 class _PaddleInferencePredictor(object):
     """ Predictor based on Paddle Inference """
 
-    def __init__(self, param_path, model_path, option, delete_pass=[]):
+    def __init__(self, param_path, model_path, option, delete_pass=()):
         super().__init__()
         self.predictor, self.inference_config, self.input_names, self.input_handlers, self.output_handlers = \
 self._create(param_path, model_path, option, delete_pass=delete_pass)
@@ -97,13 +97,13 @@ def split_dataset(dataset_root, train_rate, val_rate):
     return dataset_root
 
 
-def get_files(input_dir, format=['jpg', 'png']):
+def get_files(input_dir, format=('jpg', 'png')):
     """
     在给定目录下获取符合指定文件格式的所有文件路径
     
     Args:
         input_dir (str): 目标文件夹路径
-        format (Union[str, List[str]]): 需要获取的文件格式, 可以是字符串或者字符串列表
+        format (Union[str, List[str], Tuple[str, ...]]): 需要获取的文件格式, 可以是字符串、字符串列表或者字符串元组
     
     Returns:
         List[str]: 符合格式的所有文件路径列表，返回排序后的结果
@@ -118,13 +118,13 @@ def get_files(input_dir, format=['jpg', 'png']):
     return sorted(res)
 
 
-def get_labels_files(input_dir, format=['train.txt', 'val.txt']):
+def get_labels_files(input_dir, format=('train.txt', 'val.txt')):
     """
     在给定目录下获取符合指定文件格式的所有文件路径
     
     Args:
         input_dir (str): 目标文件夹路径
-        format (Union[str, List[str]]): 需要获取的文件格式, 可以是字符串或者字符串列表
+        format (Union[str, List[str], Tuple[str, ...]]): 需要获取的文件格式, 可以是字符串、字符串列表或者字符串元组
     
     Returns:
         List[str]: 符合格式的所有文件路径列表，返回排序后的结果
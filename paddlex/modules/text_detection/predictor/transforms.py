@@ -16,7 +16,6 @@
 import os
 import sys
 import cv2
-import copy
 import math
 import pyclipper
 import numpy as np
@@ -461,7 +460,7 @@ class CropByPolys(BaseTransform):
         dt_boxes = np.array(data[K.DT_POLYS])
         img_crop_list = []
         for bno in range(len(dt_boxes)):
-            tmp_box = copy.deepcopy(dt_boxes[bno])
+            tmp_box = dt_boxes[bno].copy()
             if self.det_box_type == "quad":
                 img_crop = self.get_rotate_crop_image(ori_im, tmp_box)
             else:
@@ -34,7 +34,7 @@ __all__ = ['OCRReisizeNormImg', 'CTCLabelDecode', 'SaveTextRecResults']
 class OCRReisizeNormImg(BaseTransform):
     """ for ocr image resize and normalization """
 
-    def __init__(self, rec_image_shape=[3, 48, 320]):
+    def __init__(self, rec_image_shape=(3, 48, 320)):
         super().__init__()
         self.rec_image_shape = rec_image_shape
 
@@ -17,8 +17,6 @@ import argparse
 import textwrap
 from types import SimpleNamespace
 
-from .pipelines import build_pipeline, BasePipeline
-from .repo_manager import setup, get_all_supported_repo_names
 from .utils import logging
 
 
@@ -26,11 +24,6 @@ def args_cfg():
     """parse cli arguments
     """
 
-    def str2bool(v):
-        """convert str to bool type
-        """
-        return v.lower() in ("true", "t", "1")
-
     def str2None(s):
         """convert to None type if it is "None"
         """
@@ -67,14 +60,14 @@ def args_cfg():
 def install(args):
     """install paddlex
     """
+    from .repo_manager import setup, get_all_supported_repo_names
+
     # Enable debug info
     os.environ['PADDLE_PDX_DEBUG'] = 'True'
     # Disable eager initialization
     os.environ['PADDLE_PDX_EAGER_INIT'] = 'False'
 
-    repo_names = args.devkits
-    if len(repo_names) == 0:
-        repo_names = get_all_supported_repo_names()
+    repo_names = args.devkits or get_all_supported_repo_names()
     setup(
         repo_names=repo_names,
         reinstall=args.reinstall or None,
@@ -88,6 +81,8 @@ def pipeline_predict(pipeline, model_name_list, model_dir_list, input_path,
                      output, device):
     """pipeline predict
     """
+    from .pipelines import build_pipeline
+
     pipeline = build_pipeline(pipeline, model_name_list, model_dir_list, output,
                               device)
     pipeline.predict({"input_path": input_path})
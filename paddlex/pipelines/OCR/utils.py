@@ -20,7 +20,6 @@ import cv2
 import numpy as np
 import random
 import math
-import copy
 
 from paddlex.utils.fonts import PINGFANG_FONT_FILE_PATH
 
@@ -23,8 +23,10 @@ from .meta import get_repo_meta
 from .utils import (install_packages_using_pip, clone_repos_using_git,
                     update_repos_using_git, uninstall_package_using_pip,
                     remove_repos_using_rm, check_installation_using_pip,
-                    build_wheel_using_pip, mute, switch_working_dir,
-                    to_dep_spec_pep508, env_marker_ast2expr)
+                    check_installation_using_metadata,
+                    check_dep_installation, build_wheel_using_pip, mute,
+                    switch_working_dir, to_dep_spec_pep508,
+                    env_marker_ast2expr)
 
 __all__ = ['build_repo_instance', 'build_repo_group_installer']
 
@@ -79,14 +81,16 @@ class PPRepository(object):
         self.get_pdx()
         return True
 
-    def check_installation(self, quick_check=False):
+    def check_installation(self, quick_check=False, in_subprocess=False):
         """ check_installation """
         if quick_check:
             lib = self._get_lib(load=False)
             return lib is not None
-        else:
+        elif in_subprocess:
             # TODO: Also check if correct dependencies are installed.
             return check_installation_using_pip(self.pkg_name)
+        else:
+            return check_installation_using_metadata(self.pkg_name)
 
     def check_repo_exiting(self, quick_check=False):
         """ check_repo_exiting """
@@ -119,8 +123,7 @@ class PPRepository(object):
                 if clean:
                     # Clean build artifacts
                     tmp_build_dir = os.path.join(self.root_dir, 'build')
-                    if os.path.exists(tmp_build_dir):
-                        shutil.rmtree(tmp_build_dir)
+                    shutil.rmtree(tmp_build_dir, ignore_errors=True)
         if extra_editable:
             with switch_working_dir(
                     os.path.join(self.root_dir, extra_editable)):
@@ -131,8 +134,7 @@ class PPRepository(object):
                     if clean:
                         # Clean build artifacts
                         tmp_build_dir = os.path.join(self.root_dir, 'build')
-                        if os.path.exists(tmp_build_dir):
-                            shutil.rmtree(tmp_build_dir)
+                        shutil.rmtree(tmp_build_dir, ignore_errors=True)
 
     def uninstall_package(self):
         """ uninstall_package """
@@ -254,7 +256,11 @@ class RepositoryGroupInstaller(object):
         ins_flags = []
         repos = self._sort_repos(self.repos, check_missing=True)
         for repo in repos:
-            if force_reinstall or not repo.check_installation():
+            # NOTE: Packages may have been uninstalled in this process, so
+            # we check in a fresh interpreter that does not see stale paths
+            # added to `sys.path` at startup.
+            if force_reinstall or not repo.check_installation(
+                    in_subprocess=True):
                 ins_flags.append(True)
             else:
                 ins_flags.append(False)
@@ -298,6 +304,9 @@ class RepositoryGroupInstaller(object):
     def install_deps(self, constraints):
         """ install_deps """
         deps_str = self.get_deps()
+        if constraints is None and self._check_deps_installation(deps_str):
+            logging.info("All dependencies are already satisfied.")
+            return
         with tempfile.TemporaryDirectory() as td:
             req_file = os.path.join(td, 'requirements.txt')
             with open(req_file, 'w', encoding='utf-8') as fr:
@@ -312,6 +321,15 @@ class RepositoryGroupInstaller(object):
             install_packages_using_pip(
                 [], req_files=[req_file], cons_files=cons_files)
 
+    def _check_deps_installation(self, deps):
+        for line in deps.splitlines():
+            line_s = line.strip()
+            if len(line_s) == 0 or line_s.startswith('#'):
+                continue
+            if not check_dep_installation(line_s):
+                return False
+        return True
+
     def _sort_repos(self, repos, check_missing=False):
         # We sort the repos to ensure that the dependencies precede the
         # dependant in the list.
@@ -19,6 +19,7 @@ import sys
 import json
 import subprocess
 import contextlib
+import importlib.metadata
 
 from parsley import makeGrammar
 
@@ -33,12 +34,41 @@ def _check_output(*args, **kwargs):
 
 def check_installation_using_pip(pkg):
     """ check_installation_using_pip """
-    out = _check_output(['pip', 'list', '--format', 'json'])
+    out = _check_output(
+        [sys.executable, '-m', 'pip', 'list', '--format', 'json'])
     out = out.rstrip()
     lst = json.loads(out)
     return any(ele['name'] == pkg for ele in lst)
 
 
+def check_installation_using_metadata(pkg):
+    """ check_installation_using_metadata """
+    # Query the metadata of the current environment directly instead of
+    # spawning `pip list`, which pays for a full interpreter start-up.
+    # NOTE: Only `sys.path` of the current process is searched, so stale
+    # metadata (e.g. egg-info of an uninstalled editable package whose
+    # source root was added to `sys.path` at startup) may still be found.
+    try:
+        importlib.metadata.distribution(pkg)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
+
+
+def check_dep_installation(dep_spec):
+    """ check_dep_installation """
+    n, e, v, m = to_dep_spec_pep508(dep_spec)
+    # Be conservative and leave extras, environment markers, URLs, and
+    # non-exact version constraints to the pip resolver.
+    if e or m is not None or isinstance(v, str):
+        return False
+    try:
+        version = importlib.metadata.version(n)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return all(op in ('==', '===') and ver == version for op, ver in v)
+
+
 def uninstall_package_using_pip(pkg):
     """ uninstall_package_using_pip """
     return _check_call([sys.executable, '-m', 'pip', 'uninstall', '-y', pkg])